@@ -24,15 +24,32 @@ Repository: https://github.com/roelvangils/shokz-battery
 __version__ = "1.2.2"
 
 import argparse
+import functools
+import io
 import json
+import mmap
 import os
 import re
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+# Use orjson for --json output when it's installed: the Rust-backed encoder
+# is several times faster than the stdlib, which adds up when --watch --json
+# is piped into another tool. The stdlib remains the zero-dependency default.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
 
 # EQ mode mappings per model family
 # Key is the headset type code from getConnectedHeadsetType
@@ -106,12 +123,18 @@ MODEL_NAMES = {
 }
 
 
+@functools.lru_cache(maxsize=64)
 def get_eq_mode_name(mode_id, headset_type):
-    """Get EQ mode name based on model and mode ID."""
+    """Get EQ mode name based on model and mode ID.
+
+    Cached: called repeatedly with the same device in --watch mode, and the
+    unknown-mode fallback builds a fresh string each time otherwise.
+    """
     modes = EQ_MODES_BY_MODEL.get(headset_type, EQ_MODES_BY_MODEL['default'])
     return modes.get(mode_id, f"Unknown ({mode_id})")
 
 
+@functools.lru_cache(maxsize=64)
 def get_model_name(headset_type):
     """Get friendly model name from type code."""
     return MODEL_NAMES.get(headset_type, headset_type)
@@ -157,6 +180,14 @@ def format_duration(minutes):
     return f"{hours}h {mins}m"
 
 
+# Audio mode cache: device routing rarely changes between --watch ticks, so
+# results are reused for a few seconds instead of re-spawning processes every
+# tick. A missing SwitchAudioSource binary is remembered for the whole run —
+# it won't appear mid-process.
+_AUDIO_CACHE_TTL = 10  # seconds
+_AUDIO_CACHE = {'expires': 0.0, 'result': None}
+
+
 def get_audio_mode():
     """
     Detect current audio output/input device and mode.
@@ -169,6 +200,10 @@ def get_audio_mode():
     - audio_quality: 'high' (USB/A2DP) or 'low' (HFP with mic)
     - missing_tool: True if SwitchAudioSource is not installed
     """
+    now = time.monotonic()
+    if _AUDIO_CACHE['result'] is not None and now < _AUDIO_CACHE['expires']:
+        return _AUDIO_CACHE['result']
+
     result = {
         'output_device': None,
         'input_device': None,
@@ -179,37 +214,44 @@ def get_audio_mode():
     }
 
     try:
-        # Check if SwitchAudioSource is available
-        output = subprocess.run(
-            ['SwitchAudioSource', '-c', '-t', 'output'],
+        # One shell spawn answers both queries; launching SwitchAudioSource
+        # twice doubled the fork/exec cost for data fetched together anyway.
+        # The echo marks where the output query ends and the input one starts.
+        proc = subprocess.run(
+            ['sh', '-c', 'SwitchAudioSource -c -t output; echo ---; SwitchAudioSource -c -t input'],
             capture_output=True, text=True, timeout=5
         )
-        if output.returncode == 0:
-            result['output_device'] = output.stdout.strip()
-            result['using_dongle'] = 'loop120' in result['output_device'].lower()
+        output_text, _, input_text = proc.stdout.partition('---')
+        output_device = output_text.strip()
+        input_device = input_text.strip()
 
-        input_result = subprocess.run(
-            ['SwitchAudioSource', '-c', '-t', 'input'],
-            capture_output=True, text=True, timeout=5
-        )
-        if input_result.returncode == 0:
-            result['input_device'] = input_result.stdout.strip()
-            result['using_bluetooth_mic'] = result['input_device'].lower() == 'bones'
-
-        # Determine audio quality
-        if result['using_dongle']:
-            result['audio_quality'] = 'high'  # USB 48kHz
-        elif result['output_device'] and 'bones' in result['output_device'].lower():
-            if result['using_bluetooth_mic']:
-                result['audio_quality'] = 'low'  # HFP 16kHz mono
-            else:
-                result['audio_quality'] = 'high'  # A2DP 44.1kHz stereo
+        # sh exits 127 when SwitchAudioSource isn't installed
+        if proc.returncode == 127 and not output_device:
+            result['missing_tool'] = True
+        else:
+            if output_device:
+                result['output_device'] = output_device
+                result['using_dongle'] = 'loop120' in output_device.lower()
+            if input_device:
+                result['input_device'] = input_device
+                result['using_bluetooth_mic'] = input_device.lower() == 'bones'
+
+            # Determine audio quality
+            if result['using_dongle']:
+                result['audio_quality'] = 'high'  # USB 48kHz
+            elif result['output_device'] and 'bones' in result['output_device'].lower():
+                if result['using_bluetooth_mic']:
+                    result['audio_quality'] = 'low'  # HFP 16kHz mono
+                else:
+                    result['audio_quality'] = 'high'  # A2DP 44.1kHz stereo
 
     except subprocess.TimeoutExpired:
         pass
     except FileNotFoundError:
         result['missing_tool'] = True
 
+    _AUDIO_CACHE['result'] = result
+    _AUDIO_CACHE['expires'] = float('inf') if result['missing_tool'] else now + _AUDIO_CACHE_TTL
     return result
 
 
@@ -219,41 +261,152 @@ def get_latest_log_dir():
     if not log_base.exists():
         return None
 
-    dirs = sorted(log_base.glob("20*"), reverse=True)
-    return dirs[0] if dirs else None
+    # Folder names are dates, so the lexicographic maximum is the newest —
+    # no need to sort the whole listing (or stat anything) to pick one.
+    return max(log_base.glob("20*"), key=lambda p: p.name, default=None)
 
 
 def hex_to_ascii(hex_str, skip_first=0):
     """Convert hex to ASCII string, stopping at null bytes."""
     try:
-        bytes_data = bytes.fromhex(hex_str)[skip_first:]
-        null_idx = bytes_data.find(b'\x00')
-        if null_idx > 0:
-            bytes_data = bytes_data[:null_idx]
-        return bytes_data.decode('ascii', errors='ignore')
-    except (ValueError, IndexError):
+        bytes_data = bytes.fromhex(hex_str)
+    except ValueError:
         return None
+    # Truncate at the first null after the skipped prefix (a leading null is
+    # kept, matching the old behaviour); slicing once avoids building an
+    # intermediate bytes object just to search it.
+    null_idx = bytes_data.find(b'\x00', skip_first)
+    end = null_idx if null_idx > skip_first else len(bytes_data)
+    return bytes_data[skip_first:end].decode('ascii', errors='ignore')
 
 
 def hex_to_mac(hex_str):
     """Convert hex to MAC address."""
-    try:
-        bytes_data = bytes.fromhex(hex_str)[:6]
-        return ':'.join(f'{b:02X}' for b in bytes_data)
-    except (ValueError, IndexError):
+    if not hex_str or len(hex_str) % 2:
         return None
+    hex_str = hex_str[:12].upper()
+    return ':'.join(hex_str[i:i + 2] for i in range(0, len(hex_str), 2))
 
 
-def parse_logs(log_dir):
-    """Parse all relevant TLV data from Shokz Connect log files."""
-    if not log_dir:
-        return None
+def nth_hex_byte(hex_str, n):
+    """Read byte n of a hex string as an int, without building a bytes object.
+
+    Raises ValueError when the string is too short or not valid hex.
+    """
+    return int(hex_str[n * 2:n * 2 + 2], 16)
+
+
+# TLV responses are identified by fixed literal markers, so the per-line scan
+# is a plain bytes.find for 'tag2:80' (memchr-fast in CPython) followed by a
+# table lookup on the two tag digits — no regex pass over the bulk of the
+# line. Each tag maps to (command literal, handler key); the command check
+# guards against an unrelated line that happens to mention a tag.
+#
+# Tag codes: 8003 battery, 800A dongle firmware, 8001 dongle MAC,
+# 800C headset type, 8002 headset firmware, 8010 multipoint, 8008 EQ,
+# 8006 voice language, 8009 connection status.
+TLV_TAG_MARKER = b'tag2:80'
+
+TLV_TAGS = {
+    b'03': (b'getDeviceBatteryLevel', 'battery'),
+    b'0A': (b'getVersionInfo', 'dongle_firmware'),
+    b'01': (b'getBluetoothAddress', 'dongle_mac'),
+    b'0C': (b'getConnectedHeadsetType', 'headset_type'),
+    b'02': (b'getDeviceVersionName', 'headset_firmware'),
+    b'10': (b'getDeviceMutConn', 'multipoint'),
+    b'08': (b'getHeadsetEQ', 'eq_mode'),
+    b'06': (b'getDeviceLanguage', 'language'),
+    b'09': (b'getBluetoothConnectionStatus', 'connection'),
+}
+
+# Small extractors that only ever run on lines already known to be TLV
+# records: the hex payload after 'value:' and the bracketed timestamp that
+# battery lines start with.
+HEX_VALUE_RE = re.compile(rb'[0-9A-Fa-f]+')
+BATTERY_TS_RE = re.compile(rb'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}:\d{3})\]')
+
+
+def _handle_dongle_firmware(value, data):
+    data['dongle_firmware'] = hex_to_ascii(value)
+
+
+def _handle_dongle_mac(value, data):
+    data['dongle_mac'] = hex_to_mac(value)
+
+
+def _handle_headset_type(value, data):
+    decoded = hex_to_ascii(value)
+    if decoded and decoded != '\x00\x00\x00\x00':
+        data['headset_type'] = decoded
+
+
+def _handle_headset_firmware(value, data):
+    data['headset_firmware'] = hex_to_ascii(value, skip_first=1)
 
-    log_files = list(log_dir.rglob("*"))
-    log_files = [f for f in log_files if f.is_file()]
 
-    # Store latest values for each data type
-    data = {
+def _handle_multipoint(value, data):
+    try:
+        data['multipoint_enabled'] = nth_hex_byte(value, 1) == 1
+        data['multipoint_connections'] = nth_hex_byte(value, 2)
+    except ValueError:
+        pass
+
+
+def _handle_eq_mode(value, data):
+    try:
+        data['eq_mode_id'] = nth_hex_byte(value, 1)
+    except ValueError:
+        pass
+
+
+def _handle_language(value, data):
+    try:
+        lang_id = nth_hex_byte(value, 0)
+        data['voice_language'] = LANGUAGES.get(lang_id, f"Unknown ({lang_id})")
+    except ValueError:
+        pass
+
+
+def _handle_connection(value, data):
+    try:
+        data['connected'] = nth_hex_byte(value, 0) == 1
+    except ValueError:
+        pass
+
+
+TLV_HANDLERS = {
+    'dongle_firmware': _handle_dongle_firmware,
+    'dongle_mac': _handle_dongle_mac,
+    'headset_type': _handle_headset_type,
+    'headset_firmware': _handle_headset_firmware,
+    'multipoint': _handle_multipoint,
+    'eq_mode': _handle_eq_mode,
+    'language': _handle_language,
+    'connection': _handle_connection,
+}
+
+
+def _build_tag_dispatch():
+    """256-slot list indexed by the tag's second hex digit.
+
+    The second digits happen to be unique across the nine tags, so a single
+    byte indexes the table directly — no hashing per match. Each slot holds
+    (tag pair, command literal, handler); the stored pair is still compared
+    to reject lookalike tags, and the battery slot's handler is None since
+    battery lines are special-cased in the scan loop for timestamp tracking.
+    """
+    table = [None] * 256
+    for tag, (command, key) in TLV_TAGS.items():
+        table[tag[1]] = (tag, command, TLV_HANDLERS.get(key))
+    return table
+
+
+_TAG_DISPATCH = _build_tag_dispatch()
+
+
+def _empty_data():
+    """Fresh result dict, one slot per data type we extract."""
+    return {
         'battery': {'value': None, 'timestamp': None},
         'dongle_firmware': None,
         'dongle_mac': None,
@@ -267,80 +420,248 @@ def parse_logs(log_dir):
         'connected': None,
     }
 
-    # Patterns for different TLV responses
-    patterns = {
-        'battery': r'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}:\d{3})\].*getDeviceBatteryLevel.*tag2:8003.*value:([0-9A-Fa-f]+)',
-        'dongle_firmware': r'getVersionInfo.*tag2:800A.*value:([0-9A-Fa-f]+)',
-        'dongle_mac': r'getBluetoothAddress.*tag2:8001.*value:([0-9A-Fa-f]+)',
-        'headset_type': r'getConnectedHeadsetType.*tag2:800C.*value:([0-9A-Fa-f]+)',
-        'headset_firmware': r'getDeviceVersionName.*tag2:8002.*value:([0-9A-Fa-f]+)',
-        'multipoint': r'getDeviceMutConn.*tag2:8010.*value:([0-9A-Fa-f]+)',
-        'eq_mode': r'getHeadsetEQ.*tag2:8008.*value:([0-9A-Fa-f]+)',
-        'language': r'getDeviceLanguage.*tag2:8006.*value:([0-9A-Fa-f]+)',
-        'connection': r'getBluetoothConnectionStatus.*tag2:8009.*value:([0-9A-Fa-f]+)',
-    }
 
-    for log_file in log_files:
-        try:
-            with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+def _parse_log_timestamp(timestamp_str):
+    """Parse a '2025-01-15 09:30:00:123' log timestamp.
+
+    Fixed-width slicing is several times faster than strptime, which
+    re-interprets its format string on every call.
+    """
+    return datetime(
+        int(timestamp_str[0:4]), int(timestamp_str[5:7]), int(timestamp_str[8:10]),
+        int(timestamp_str[11:13]), int(timestamp_str[14:16]), int(timestamp_str[17:19]),
+        int(timestamp_str[20:23]) * 1000,
+    )
+
+
+def _scan_tlv_lines(lines, data):
+    """Run the TLV scan over an iterator of bytes lines.
 
-            # Parse battery (with timestamp tracking)
-            for match in re.finditer(patterns['battery'], content):
-                timestamp_str = match.group(1)
-                value_hex = match.group(2)
+    Fills data in place and returns (best_timestamp, best_value, consumed):
+    the newest raw battery sample seen — the timestamps are fixed-width, so
+    the raw bytes compare in chronological order — plus the number of bytes
+    covered by complete lines. A half-written last line is not counted or
+    parsed: a marker could be split across writes, so it's left for the
+    next read.
+    """
+    best_timestamp = None
+    best_value = None
+    consumed = 0
+    for line in lines:
+        if not line.endswith(b'\n'):
+            break
+        consumed += len(line)
+        tag_at = line.find(TLV_TAG_MARKER)
+        if tag_at < 0:
+            continue
+        tag = line[tag_at + 7:tag_at + 9]
+        if len(tag) < 2:
+            continue
+        entry = _TAG_DISPATCH[tag[1]]
+        if entry is None or entry[0] != tag:
+            continue
+        _, command, handler = entry
+        # The command name always precedes the tag, so the check can
+        # stop scanning at the marker instead of covering the line.
+        if line.find(command, 0, tag_at) < 0:
+            continue
+        value_at = line.find(b'value:', tag_at)
+        if value_at < 0:
+            continue
+        match = HEX_VALUE_RE.match(line, value_at + 6)
+        if match is None:
+            continue
+        value = match.group()
+
+        if handler is None:
+            # Battery lines also carry the timestamp we track
+            ts_match = BATTERY_TS_RE.match(line)
+            if ts_match:
+                timestamp = ts_match.group(1)
+                if best_timestamp is None or timestamp > best_timestamp:
+                    best_timestamp = timestamp
+                    best_value = value
+        else:
+            # Other values (just keep latest occurrence)
+            handler(value.decode('ascii'), data)
+    return best_timestamp, best_value, consumed
+
+
+def _parse_log_file(log_file, start_offset=0, previous=None):
+    """Extract TLV data from a single log file.
+
+    Returns (data, end_offset). When start_offset/previous are given, only
+    the bytes appended since the last read are parsed and folded into a copy
+    of the previous result — the caller is responsible for detecting log
+    rotation and truncation and restarting from the top.
+    """
+    if previous is not None:
+        data = dict(previous)
+        data['battery'] = dict(previous['battery'])
+    else:
+        data = _empty_data()
+    best_timestamp = None
+    best_value = None
+    end_offset = start_offset
+    try:
+        with open(log_file, 'rb') as f:
+            if start_offset:
+                # Tail read: the appended delta is usually small, so a plain
+                # buffered read is enough.
+                f.seek(start_offset)
+                best_timestamp, best_value, consumed = _scan_tlv_lines(f, data)
+            else:
+                # Full parse: map the file so the scan works straight out of
+                # the OS page cache instead of copying the whole file into
+                # the Python heap first.
                 try:
-                    timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S:%f')
-                    if data['battery']['timestamp'] is None or timestamp > data['battery']['timestamp']:
-                        data['battery'] = {'value': value_hex, 'timestamp': timestamp}
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
                 except ValueError:
-                    continue
-
-            # Parse other values (just get latest occurrence)
-            for key, pattern in patterns.items():
-                if key == 'battery':
-                    continue
-                for match in re.finditer(pattern, content):
-                    value = match.group(1)
-                    if key == 'dongle_firmware':
-                        data['dongle_firmware'] = hex_to_ascii(value)
-                    elif key == 'dongle_mac':
-                        data['dongle_mac'] = hex_to_mac(value)
-                    elif key == 'headset_type':
-                        decoded = hex_to_ascii(value)
-                        if decoded and decoded != '\x00\x00\x00\x00':
-                            data['headset_type'] = decoded
-                    elif key == 'headset_firmware':
-                        data['headset_firmware'] = hex_to_ascii(value, skip_first=1)
-                    elif key == 'multipoint':
-                        try:
-                            bytes_data = bytes.fromhex(value)
-                            data['multipoint_enabled'] = bytes_data[1] == 1
-                            data['multipoint_connections'] = bytes_data[2]
-                        except (ValueError, IndexError):
-                            pass
-                    elif key == 'eq_mode':
-                        try:
-                            bytes_data = bytes.fromhex(value)
-                            data['eq_mode_id'] = bytes_data[1]
-                        except (ValueError, IndexError):
-                            pass
-                    elif key == 'language':
-                        try:
-                            bytes_data = bytes.fromhex(value)
-                            lang_id = bytes_data[0]
-                            data['voice_language'] = LANGUAGES.get(lang_id, f"Unknown ({lang_id})")
-                        except (ValueError, IndexError):
-                            pass
-                    elif key == 'connection':
-                        try:
-                            bytes_data = bytes.fromhex(value)
-                            data['connected'] = bytes_data[0] == 1
-                        except (ValueError, IndexError):
-                            pass
-
-        except (IOError, OSError):
+                    # Empty files can't be mapped (and have nothing to parse)
+                    consumed = 0
+                else:
+                    try:
+                        best_timestamp, best_value, consumed = _scan_tlv_lines(
+                            iter(mm.readline, b''), data
+                        )
+                    finally:
+                        mm.close()
+            end_offset = start_offset + consumed
+    except (IOError, OSError):
+        pass
+
+    if best_timestamp is not None:
+        try:
+            timestamp = _parse_log_timestamp(best_timestamp.decode('ascii'))
+            if data['battery']['timestamp'] is None or timestamp > data['battery']['timestamp']:
+                data['battery'] = {'value': best_value.decode('ascii'), 'timestamp': timestamp}
+        except ValueError:
+            pass
+    return data, end_offset
+
+
+def _merge_file_data(data, file_data):
+    """Fold one file's values into the combined result.
+
+    Files are visited newest first, so a slot that's already filled came
+    from a more recent file and must not be overwritten.
+    """
+    if data['battery']['value'] is None and file_data['battery']['value'] is not None:
+        data['battery'] = file_data['battery']
+    for key, value in file_data.items():
+        if key == 'battery':
             continue
+        if data[key] is None and value is not None:
+            data[key] = value
+
+
+def _is_complete(data):
+    """True once every slot ('eq_mode' is derived later) is filled."""
+    if data['battery']['value'] is None:
+        return False
+    return all(
+        value is not None
+        for key, value in data.items()
+        if key not in ('battery', 'eq_mode')
+    )
+
+
+# Per-file parse cache, mainly for --watch mode: path -> (mtime, size,
+# inode, read offset, extracted data). A file whose stat info hasn't changed
+# is served from the cache without being opened, so idle watch ticks cost
+# one stat per file; a file that merely grew is tail-read from the saved
+# offset. The inode detects log rotation, where a fresh file takes over the
+# old name and must be parsed from the top.
+_FILE_CACHE = {}
+
+
+def _refresh_file(path, mtime, size, inode):
+    """(Re-)parse one file and update its cache entry.
+
+    Reads only the appended bytes when the cached entry is for the same
+    inode and the file hasn't shrunk; otherwise parses from the top.
+    """
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[2] == inode and size >= cached[3]:
+        file_data, offset = _parse_log_file(path, start_offset=cached[3], previous=cached[4])
+    else:
+        file_data, offset = _parse_log_file(path)
+    _FILE_CACHE[path] = (mtime, size, inode, offset, file_data)
+    return file_data
+
+# Parsing is independent per file, but a pool only earns its startup cost
+# when several files actually need re-reading (first run, or a cold cache).
+# Below this many stale files the sequential newest-first loop — with its
+# early exit — handles them.
+_PARALLEL_MIN_FILES = 4
+
+
+def _iter_log_files(root):
+    """Yield (path, stat) for every .log file under root.
+
+    A flat os.scandir walk keeps the directory/file checks on the data
+    readdir already returned, instead of the per-entry Path objects and
+    extra stat calls that Path.glob would make. Paths are yielded as plain
+    strings since they only ever get passed to open().
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith('.log'):
+                            yield entry.path, entry.stat()
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def parse_logs(log_dir):
+    """Parse all relevant TLV data from Shokz Connect log files."""
+    if not log_dir:
+        return None
+
+    candidates = [
+        (st.st_mtime, st.st_size, path, st.st_ino)
+        for path, st in _iter_log_files(log_dir)
+    ]
+
+    ordered = sorted(candidates, reverse=True)
+
+    # When many files need a real parse, warm the cache with a thread pool.
+    # Threads rather than processes: the per-line work is dominated by
+    # C-level bytes.find and buffered reads, so workers overlap well while
+    # a process pool would cost more to spin up than the parse itself.
+    stale = [
+        entry for entry in ordered
+        if _FILE_CACHE.get(entry[2], (None, None))[:2] != entry[:2]
+    ]
+    if len(stale) >= _PARALLEL_MIN_FILES:
+        workers = min(len(stale), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(
+                lambda entry: _refresh_file(entry[2], entry[0], entry[1], entry[3]), stale
+            ):
+                pass
+
+    data = _empty_data()
+
+    # Newest file first: the freshest sample of each value lives in the most
+    # recently written log, so once every slot is filled the older (often
+    # much larger) rotated files never need to be read at all.
+    for mtime, size, log_file, inode in ordered:
+        cached = _FILE_CACHE.get(log_file)
+        if cached is not None and cached[0] == mtime and cached[1] == size:
+            file_data = cached[4]
+        else:
+            file_data = _refresh_file(log_file, mtime, size, inode)
+        _merge_file_data(data, file_data)
+        if _is_complete(data):
+            break
 
     # Resolve EQ mode name based on headset type
     if data['eq_mode_id'] is not None:
@@ -358,10 +679,8 @@ def decode_battery(hex_value):
     Formula: percentage = (level + 1) × 10, capped at 100%
     """
     try:
-        value_bytes = bytes.fromhex(hex_value)
-
-        if len(value_bytes) >= 2:
-            level_indicator = value_bytes[1]
+        if len(hex_value) >= 4:
+            level_indicator = nth_hex_byte(hex_value, 1)
             percentage = min((level_indicator + 1) * 10, 100)
 
             if percentage >= 70:
@@ -384,11 +703,38 @@ def decode_battery(hex_value):
     return None
 
 
+# ANSI color codes
+RESET = "\033[0m"
+GREEN = "\033[32m"
+YELLOW = "\033[33m"
+RED = "\033[31m"
+CYAN = "\033[36m"
+DIM = "\033[2m"
+
+
+def _battery_bar(percentage):
+    """Render the visual battery bar (10 segments, colored by charge)."""
+    if percentage >= 70:
+        bar_color = GREEN
+    elif percentage >= 40:
+        bar_color = YELLOW
+    else:
+        bar_color = RED
+    filled = percentage // 10
+    return f"{bar_color}{'■' * filled}{DIM}{'□' * (10 - filled)}{RESET}"
+
+
+# Battery comes back in 10% steps, so there are only eleven possible bars —
+# build them once and index by percentage // 10 instead of re-concatenating
+# the segments on every render.
+BATTERY_BARS = [_battery_bar(pct) for pct in range(0, 101, 10)]
+
+
 def format_output(data, as_json=False, verbose=False, compact=False):
     """Format the output for display."""
     if not data or not data['battery']['value']:
         if as_json:
-            return json.dumps({'success': False, 'error': 'No data found'}, indent=2)
+            return _dumps({'success': False, 'error': 'No data found'})
         if compact:
             return "⚠️ No data"
         return "Error: No battery data found. Is Shokz Connect running?"
@@ -450,42 +796,26 @@ def format_output(data, as_json=False, verbose=False, compact=False):
             },
             'connected': data['connected'],
         }
-        return json.dumps(output, indent=2)
+        return _dumps(output)
 
-    # ANSI color codes
-    RESET = "\033[0m"
-    GREEN = "\033[32m"
-    YELLOW = "\033[33m"
-    RED = "\033[31m"
-    CYAN = "\033[36m"
-    DIM = "\033[2m"
+    # Plain text output, accumulated in a single buffer and emitted once
+    buf = io.StringIO()
 
-    # Plain text output
-    lines = []
+    def put(line):
+        buf.write(line)
+        buf.write('\n')
 
     if battery:
-        # Create visual battery bar (10 segments for 0-100%)
-        filled = battery['percentage'] // 10
-        empty = 10 - filled
-
-        # Color based on battery level
-        if battery['percentage'] >= 70:
-            bar_color = GREEN
-        elif battery['percentage'] >= 40:
-            bar_color = YELLOW
-        else:
-            bar_color = RED
-
-        bar = f"{bar_color}{'■' * filled}{DIM}{'□' * empty}{RESET}"
+        bar = BATTERY_BARS[battery['percentage'] // 10]
 
         # Add estimate to battery line
         if estimate_minutes and estimate_minutes > 0:
             estimate_str = format_duration(estimate_minutes)
-            lines.append(f"Battery: {bar} {battery['percentage']}% {DIM}(~{estimate_str} remaining){RESET}")
+            put(f"Battery: {bar} {battery['percentage']}% {DIM}(~{estimate_str} remaining){RESET}")
         else:
-            lines.append(f"Battery: {bar} {battery['percentage']}%")
+            put(f"Battery: {bar} {battery['percentage']}%")
     else:
-        lines.append(f"Battery: Unknown (raw: {data['battery']['value']})")
+        put(f"Battery: Unknown (raw: {data['battery']['value']})")
 
     # Show model, EQ mode, and audio quality in compact output
     info_parts = []
@@ -506,57 +836,93 @@ def format_output(data, as_json=False, verbose=False, compact=False):
             # Not using Shokz for audio output
             info_parts.append(f"{DIM}Audio: inactive{RESET}")
     if info_parts:
-        lines.append(" · ".join(info_parts))
+        put(" · ".join(info_parts))
 
     # Show hint if SwitchAudioSource is not installed
     if audio['missing_tool']:
-        lines.append(f"{DIM}Tip: brew install switchaudio-osx for audio mode detection{RESET}")
+        put(f"{DIM}Tip: brew install switchaudio-osx for audio mode detection{RESET}")
 
     # Low battery warning
     if battery and battery['percentage'] <= 20:
-        lines.append(f"{RED}⚠️  Time to charge! You might not make it through your next meeting.{RESET}")
+        put(f"{RED}⚠️  Time to charge! You might not make it through your next meeting.{RESET}")
 
     if data['battery']['timestamp']:
-        lines.append(f"{DIM}Updated: {data['battery']['timestamp'].strftime('%H:%M:%S')}{RESET}")
+        put(f"{DIM}Updated: {data['battery']['timestamp'].strftime('%H:%M:%S')}{RESET}")
 
         # Check how stale the data is
         age = datetime.now() - data['battery']['timestamp']
         age_minutes = age.total_seconds() / 60
 
         if age_minutes > 60:
-            lines.append(f"{YELLOW}⚠️  Data is over an hour old and may be inaccurate. Open Shokz Connect to refresh.{RESET}")
+            put(f"{YELLOW}⚠️  Data is over an hour old and may be inaccurate. Open Shokz Connect to refresh.{RESET}")
         elif age_minutes > 10:
-            lines.append(f"{DIM}💡 Shokz Connect may not be running. Start it for real-time updates.{RESET}")
+            put(f"{DIM}💡 Shokz Connect may not be running. Start it for real-time updates.{RESET}")
 
     if verbose:
-        lines.append("")
-        lines.append("Headset:")
+        put("")
+        put("Headset:")
         if data['headset_type']:
             model_name = get_model_name(data['headset_type'])
             if model_name != data['headset_type']:
-                lines.append(f"  Model: {model_name} ({data['headset_type']})")
+                put(f"  Model: {model_name} ({data['headset_type']})")
             else:
-                lines.append(f"  Model: {data['headset_type']}")
+                put(f"  Model: {data['headset_type']}")
         if data['headset_firmware']:
-            lines.append(f"  Firmware: {data['headset_firmware']}")
+            put(f"  Firmware: {data['headset_firmware']}")
         if data['eq_mode']:
-            lines.append(f"  EQ Mode: {data['eq_mode']}")
+            put(f"  EQ Mode: {data['eq_mode']}")
         if data['voice_language']:
-            lines.append(f"  Voice: {data['voice_language']}")
+            put(f"  Voice: {data['voice_language']}")
         if data['multipoint_enabled'] is not None:
             status = "Enabled" if data['multipoint_enabled'] else "Disabled"
             if data['multipoint_connections']:
                 status += f" ({data['multipoint_connections']} connected)"
-            lines.append(f"  Multipoint: {status}")
+            put(f"  Multipoint: {status}")
 
-        lines.append("")
-        lines.append("Dongle:")
+        put("")
+        put("Dongle:")
         if data['dongle_firmware']:
-            lines.append(f"  Firmware: {data['dongle_firmware']}")
+            put(f"  Firmware: {data['dongle_firmware']}")
         if data['dongle_mac']:
-            lines.append(f"  MAC: {data['dongle_mac']}")
+            put(f"  MAC: {data['dongle_mac']}")
+
+    return buf.getvalue()[:-1]  # drop the trailing newline; print() adds one
+
 
-    return '\n'.join(lines)
+def _watch_with_events(log_dir, render, interval):
+    """Event-driven watch loop, re-rendering only when the logs change.
+
+    Uses the optional watchdog package (FSEvents on macOS) so an idle watch
+    costs no CPU at all between log writes. Returns False when watchdog
+    isn't installed; the caller then falls back to plain polling.
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return False
+
+    wake = threading.Event()
+
+    class _LogChanged(FileSystemEventHandler):
+        def on_any_event(self, event):
+            wake.set()
+
+    observer = Observer()
+    observer.schedule(_LogChanged(), os.fspath(log_dir), recursive=True)
+    observer.start()
+    try:
+        while True:
+            render()
+            # Block until the logs change, but re-render at the normal
+            # interval regardless so the staleness hints stay current.
+            wake.wait(timeout=interval)
+            if wake.is_set():
+                time.sleep(0.5)  # debounce bursty writes
+                wake.clear()
+    finally:
+        observer.stop()
+        observer.join()
 
 
 def main():
@@ -608,14 +974,18 @@ Examples:
         return 0 if (data and data['battery']['value']) else 1
 
     if args.watch:
+        def render():
+            os.system('clear' if os.name != 'nt' else 'cls')
+            print(f"Shokz Battery Monitor (updating every {args.watch_interval}s)")
+            print("=" * 40)
+            get_and_print()
+            print("\nPress Ctrl+C to exit")
+
         try:
-            while True:
-                os.system('clear' if os.name != 'nt' else 'cls')
-                print(f"Shokz Battery Monitor (updating every {args.watch_interval}s)")
-                print("=" * 40)
-                get_and_print()
-                print("\nPress Ctrl+C to exit")
-                time.sleep(args.watch_interval)
+            if not _watch_with_events(log_dir, render, args.watch_interval):
+                while True:
+                    render()
+                    time.sleep(args.watch_interval)
         except KeyboardInterrupt:
             print("\nExiting...")
             return 0